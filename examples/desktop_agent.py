@@ -13,6 +13,23 @@ from screenenv import DesktopAgentBase, Sandbox
 from .utils import get_user_input
 
 
+class _StripCombining(dict):
+    """str.translate table dropping combining marks, filled lazily per code point"""
+
+    def __missing__(self, codepoint: int) -> int | None:
+        value = None if unicodedata.combining(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+_STRIP_COMBINING = _StripCombining()
+
+
+def normalize_text(text: str) -> str:
+    """Remove accents and other combining marks from text"""
+    return unicodedata.normalize("NFD", text).translate(_STRIP_COMBINING)
+
+
 class CustomDesktopAgent(DesktopAgentBase):
     """Agent for desktop automation"""
 
@@ -100,13 +117,6 @@ class CustomDesktopAgent(DesktopAgentBase):
             self.logger.log(f"Moved mouse to coordinates ({x}, {y})")
             return f"Moved mouse to coordinates ({x}, {y})"
 
-        def normalize_text(text):
-            return "".join(
-                c
-                for c in unicodedata.normalize("NFD", text)
-                if not unicodedata.combining(c)
-            )
-
         @tool
         def write(text: str) -> str:
             """
@@ -230,20 +240,24 @@ class CustomDesktopAgent(DesktopAgentBase):
             return "Went back one page"
 
         # Register the tools
-        self.tools["click"] = click
-        self.tools["right_click"] = right_click
-        self.tools["double_click"] = double_click
-        self.tools["move_mouse"] = move_mouse
-        self.tools["write"] = write
-        self.tools["press"] = press
-        self.tools["scroll"] = scroll
-        self.tools["wait"] = wait
-        self.tools["open"] = open
-        self.tools["go_back"] = go_back
-        self.tools["drag"] = drag
-        self.tools["launch_app"] = launch_app
-        self.tools["execute"] = execute
-        self.tools["refresh"] = refresh
+        self.tools.update(
+            {
+                "click": click,
+                "right_click": right_click,
+                "double_click": double_click,
+                "move_mouse": move_mouse,
+                "write": write,
+                "press": press,
+                "scroll": scroll,
+                "wait": wait,
+                "open": open,
+                "go_back": go_back,
+                "drag": drag,
+                "launch_app": launch_app,
+                "execute": execute,
+                "refresh": refresh,
+            }
+        )
 
 
 if __name__ == "__main__":
@@ -284,9 +298,10 @@ if __name__ == "__main__":
     # ================================
 
     # Interactive task input loop
-    sandbox = None
-    agent = None
     while True:
+        # Each task gets exactly one sandbox, owned by this iteration
+        sandbox = None
+        agent = None
         try:
             task = get_user_input()
             if task is None:
@@ -306,6 +321,8 @@ if __name__ == "__main__":
             if sandbox:
                 sandbox.end_recording("recording.mp4")
             if agent:
-                agent.close()
+                agent.close()  # also kills the sandbox
+            elif sandbox:
+                sandbox.close()
 
         print("\n" + "=" * 60)
@@ -12,9 +12,9 @@ from PIL import Image
 from screenenv import MCPRemoteServer
 
 
-def sleep(seconds: float = 1.0) -> None:
+async def sleep(seconds: float = 1.0) -> None:
     """Wait for specified seconds to make actions visible"""
-    time.sleep(seconds)
+    await asyncio.sleep(seconds)
 
 
 @asynccontextmanager
@@ -64,14 +64,14 @@ async def demo_complex_gui_automation() -> None:
         # PHASE 1: TERMINAL INTELLIGENCE GATHERING
         # ========================================
         print("\n📊 PHASE 1: Terminal Intelligence Gathering")
-        sleep(4)
+        await sleep(4)
 
         # Launch terminal and perform system analysis
         print("Launching xfce4-terminal for system analysis...")
         await session.call_tool(
             "launch", {"application": "xfce4-terminal", "wait_for_window": True}
         )
-        sleep(1)
+        await sleep(1)
 
         # Perform comprehensive system analysis
         system_commands = [
@@ -92,7 +92,7 @@ async def demo_complex_gui_automation() -> None:
         for cmd in system_commands:
             await session.call_tool("write", {"text": cmd})
             await session.call_tool("press", {"key": ["Enter"]})
-            sleep(0.5)
+            await sleep(0.5)
 
         # Get terminal window and activate it
         result = await session.call_tool(
@@ -114,17 +114,17 @@ async def demo_complex_gui_automation() -> None:
         # Open multiple research tabs
         print("Opening https://www.huggingface.co for research...")
         await session.call_tool("open", {"file_or_url": "https://www.huggingface.co/"})
-        sleep(3)
+        await sleep(3)
         print(await session.call_tool("move_mouse", {"x": 1200, "y": 120}))
-        sleep(0.5)
+        await sleep(0.5)
         print(await session.call_tool("left_click", {}))
-        sleep(1)
+        await sleep(1)
         print(await session.call_tool("move_mouse", {"x": 1200, "y": 160}))
         print(await session.call_tool("left_click", {}))
-        sleep(2)
+        await sleep(2)
         print(await session.call_tool("move_mouse", {"x": 1600, "y": 320}))
         print(await session.call_tool("left_click", {}))
-        sleep(1)
+        await sleep(1)
 
         for i in range(5):
             await session.call_tool(
@@ -135,7 +135,7 @@ async def demo_complex_gui_automation() -> None:
         await session.call_tool(
             "launch", {"application": "xfce4-terminal", "wait_for_window": True}
         )
-        sleep(1)
+        await sleep(1)
 
         # Write an enthusiastic AI comment about HuggingFace
         await session.call_tool("press", {"key": ["Enter"]})
@@ -146,7 +146,7 @@ async def demo_complex_gui_automation() -> None:
                 "delay_in_ms": 30,
             },
         )
-        sleep(2)
+        await sleep(2)
         await session.call_tool(
             "write",
             {
@@ -163,7 +163,7 @@ async def demo_complex_gui_automation() -> None:
             await session.call_tool("close_window", {"window_id": terminal_id})
         await session.call_tool("press", {"key": ["Ctrl", "W"]})
 
-        sleep(1)
+        await sleep(1)
 
         # ========================================
         # PHASE 3: DOCUMENT CREATION & WRITING
@@ -175,9 +175,9 @@ async def demo_complex_gui_automation() -> None:
         await session.call_tool(
             "launch", {"application": "libreoffice --writer", "wait_for_window": True}
         )
-        sleep(1)
+        await sleep(1)
         await session.call_tool("press", {"key": ["Ctrl", "W"]})
-        sleep(1)
+        await sleep(1)
 
         # Create a professional report
         report_content = [
@@ -211,7 +211,7 @@ async def demo_complex_gui_automation() -> None:
             "Date: " + time.strftime("%Y-%m-%d %H:%M:%S"),
         ]
 
-        sleep(1)
+        await sleep(1)
         # Type the report content
         for line in report_content:
             await session.call_tool("write", {"text": line, "delay_in_ms": 10})
@@ -219,14 +219,14 @@ async def demo_complex_gui_automation() -> None:
 
         # Format the document (select all and apply formatting)
         await session.call_tool("press", {"key": ["Ctrl", "A"]})  # Select all
-        sleep(0.5)
+        await sleep(0.5)
 
         # Save the document
         await session.call_tool("press", {"key": ["Ctrl", "S"]})
-        sleep(1)
+        await sleep(1)
         await session.call_tool("write", {"text": "ai_agent_report_mcp.odt"})
         await session.call_tool("press", {"key": ["Enter"]})
-        sleep(2)
+        await sleep(2)
 
         print("📄 Professional report created and saved")
 
@@ -240,7 +240,7 @@ async def demo_complex_gui_automation() -> None:
         await session.call_tool(
             "launch", {"application": "libreoffice --calc", "wait_for_window": True}
         )
-        sleep(1)
+        await sleep(1)
 
         # Create sample data for analysis
         sample_data = [
@@ -276,7 +276,7 @@ async def demo_complex_gui_automation() -> None:
                         await session.call_tool(
                             "press", {"key": ["Home"]}
                         )  # Go to beginning of current row (column A)
-                        sleep(0.1)
+                        await sleep(0.1)
                         await session.call_tool(
                             "press", {"key": ["Down"]}
                         )  # Move down to next row
@@ -285,14 +285,14 @@ async def demo_complex_gui_automation() -> None:
 
         # Create a chart (select data and insert chart)
         await session.call_tool("press", {"key": ["Ctrl", "A"]})  # Select all data
-        sleep(0.5)
+        await sleep(0.5)
 
         # Save the spreadsheet
         await session.call_tool("press", {"key": ["Ctrl", "S"]})
-        sleep(1)
+        await sleep(1)
         await session.call_tool("write", {"text": "sales_analysis_mcp.ods"})
         await session.call_tool("press", {"key": ["Enter"]})
-        sleep(2)
+        await sleep(2)
 
         print("📈 Data analysis spreadsheet created")
 
@@ -301,7 +301,7 @@ async def demo_complex_gui_automation() -> None:
         # ========================================
         print("\n📁 PHASE 5: File Management & Organization")
         await session.call_tool("launch", {"application": "xfce4-terminal"})
-        sleep(1)
+        await sleep(1)
 
         # Create organized workspace
         workspace_commands = [
@@ -315,13 +315,13 @@ async def demo_complex_gui_automation() -> None:
         # Switch back to terminal
         if terminal_id:
             await session.call_tool("activate_window", {"window_id": terminal_id})
-        sleep(1)
+        await sleep(1)
         await session.call_tool("press", {"key": ["Ctrl", "L"]})
 
         for cmd in workspace_commands:
             await session.call_tool("write", {"text": cmd})
             await session.call_tool("press", {"key": ["Enter"]})
-            sleep(0.5)
+            await sleep(0.5)
 
         # Move created files to organized workspace
         file_management_commands = [
@@ -333,7 +333,7 @@ async def demo_complex_gui_automation() -> None:
         for cmd in file_management_commands:
             await session.call_tool("write", {"text": cmd, "delay_in_ms": 1})
             await session.call_tool("press", {"key": ["Enter"]})
-            sleep(0.5)
+            await sleep(0.5)
 
         print("📂 Workspace organized and files managed")
 
@@ -372,7 +372,7 @@ async def demo_complex_gui_automation() -> None:
         # Final cleanup message
         if terminal_id:
             await session.call_tool("activate_window", {"window_id": terminal_id})
-        sleep(1)
+        await sleep(1)
         await session.call_tool(
             "write",
             {
@@ -50,8 +50,7 @@ def demo_complex_gui_automation() -> None:
 
         # Launch terminal and perform system analysis
         print("Launching xfce4-terminal for system analysis...")
-        s.launch("xfce4-terminal", wait_for_window=True)
-        sleep(1)
+        terminal_id = s.launch_and_focus("xfce4-terminal")
 
         # Perform comprehensive system analysis
         system_commands = [
@@ -69,17 +68,10 @@ def demo_complex_gui_automation() -> None:
             "echo '=== ANALYSIS COMPLETE ==='",
         ]
 
-        for cmd in system_commands:
-            s.write(cmd, delay_in_ms=10)
-            s.press("Enter")
-            sleep(0.5)
-
-        sleep(0.5)
-
-        # Get terminal window and activate it
-        terminal_windows = s.get_application_windows("xfce4-terminal")
-        terminal_id = terminal_windows[0]
-        s.activate_window(terminal_id)
+        # Run the whole analysis as one command line, pasted in a single key press
+        s.paste("; ".join(system_commands), hotkey="Ctrl+Shift+V")
+        s.press("Enter")
+        sleep(1)
 
         s.close_window(terminal_id)
 
@@ -95,23 +87,19 @@ def demo_complex_gui_automation() -> None:
         print("Opening https://www.huggingface.co for research...")
         s.open("https://www.huggingface.co/")
         sleep(1)
-        s.move_mouse(1200, 120)
-        sleep(0.5)
-        s.left_click()
+        # left_click moves the pointer itself, one request per click
+        s.left_click(1200, 120)
         sleep(1)
-        s.move_mouse(1200, 160)
-        s.left_click()
+        s.left_click(1200, 160)
         sleep(2)
-        s.move_mouse(1600, 320)
-        s.left_click()
+        s.left_click(1600, 320)
         sleep(1)
 
-        for i in range(5):
-            s.scroll(direction="down", amount=10)
+        # One request for the whole scroll instead of five
+        s.scroll(direction="down", amount=50)
 
         print("Launching xfce4-terminal for system analysis...")
-        s.launch("xfce4-terminal", wait_for_window=True)
-        sleep(1)
+        terminal_id = s.launch_and_focus("xfce4-terminal")
 
         # Write an enthusiastic AI comment about HuggingFace
         s.press("Enter")
@@ -121,9 +109,6 @@ def demo_complex_gui_automation() -> None:
         )
         sleep(2)
         s.write(" Hmmmm... Jokes aside, back to work! An AI's job is never done... 🤖")
-        terminal_windows = s.get_application_windows("xfce4-terminal")
-        terminal_id = terminal_windows[0]
-        s.activate_window(terminal_id)
         s.close_window(terminal_id)
         s.press(["Ctrl", "W"])
 
@@ -136,7 +121,7 @@ def demo_complex_gui_automation() -> None:
 
         # Launch LibreOffice Writer
         print("Launching LibreOffice Writer...")
-        s.launch("libreoffice --writer", wait_for_window=True)
+        s.launch_and_focus("libreoffice --writer")
         sleep(1)
         s.press("Enter")
 
@@ -171,10 +156,8 @@ def demo_complex_gui_automation() -> None:
         ]
 
         sleep(1)
-        # Type the report content
-        for line in report_content:
-            s.write(line, delay_in_ms=1)
-            s.press("Enter")
+        # Paste the report content in one go instead of typing it key by key
+        s.paste("\n".join(report_content) + "\n")
 
         # Format the document (select all and apply formatting)
         s.press(["Ctrl", "A"])  # Select all
@@ -196,7 +179,7 @@ def demo_complex_gui_automation() -> None:
 
         # Launch LibreOffice Calc
         print("Launching LibreOffice Calc for data analysis...")
-        s.launch("libreoffice --calc", wait_for_window=True)
+        s.launch_and_focus("libreoffice --calc")
         sleep(1)
 
         # Create sample data for analysis
@@ -210,27 +193,15 @@ def demo_complex_gui_automation() -> None:
             ["June", "320", "32000", "14%"],
         ]
 
-        # Enter data into spreadsheet - OPTIMIZED VERSION
+        # Enter data into spreadsheet
         print("📊 Entering data into spreadsheet...")
 
-        # Start at A1 and enter data row by row for better efficiency
-        s.press(["Ctrl", "Home"])  # Go to A1 once
-
-        for row_idx, row_data in enumerate(sample_data):
-            # For each row, enter all columns sequentially
-            for col_idx, cell_data in enumerate(row_data):
-                # Write the data
-                s.write(str(cell_data))
-
-                # Move to next cell (right for same row, or down to next row)
-                if col_idx < len(row_data) - 1:
-                    s.press("Right")  # Move to next column
-                else:
-                    # End of row - move to first column of next row
-                    if row_idx < len(sample_data) - 1:
-                        s.press("Home")  # Go to beginning of current row (column A)
-                        sleep(0.1)
-                        s.press("Down")  # Move down to next row
+        # Paste the whole grid as tab-separated text starting at A1, Calc
+        # splits it into cells (Enter accepts its Text Import dialog)
+        s.press(["Ctrl", "Home"])
+        s.paste("\n".join("\t".join(row) for row in sample_data))
+        sleep(1)  # Let the Text Import dialog open before accepting it
+        s.press("Enter")
 
         print("✅ Data entry completed")
 
@@ -248,8 +219,7 @@ def demo_complex_gui_automation() -> None:
         print("📈 Data analysis spreadsheet created")
 
         print("\n📁 PHASE 5: File Management & Organization")
-        s.launch("xfce4-terminal")
-        sleep(1)
+        terminal_id = s.launch_and_focus("xfce4-terminal")
 
         # Create organized workspace
         workspace_commands = [
@@ -260,9 +230,6 @@ def demo_complex_gui_automation() -> None:
             "ls -la ~/ai_agent_workspace",
         ]
 
-        # Switch back to terminal
-        s.activate_window(terminal_id)
-        sleep(1)
         s.press("Ctrl+L")
 
         for cmd in workspace_commands:
@@ -292,22 +259,30 @@ def demo_complex_gui_automation() -> None:
         # Take final screenshots of all applications
         # Use correct browser name based on architecture
         # x86_64 uses "google-chrome", aarch64 uses "chromium"
-        applications = ["chromium", "google-chrome", "libreoffice"]
-
+        applications = ["chromium", "google-chrome"]
+
+        # launch_and_focus recorded exactly the Writer and Calc windows this demo
+        # opened (windows that were already open are excluded), so LibreOffice
+        # does not need to be looked up again and pre-existing windows are kept
+        windows = [
+            *s.windows.get("libreoffice --writer", []),
+            *s.windows.get("libreoffice --calc", []),
+        ]
         for app in applications:
             try:
-                windows = s.get_application_windows(app)
-                for window in windows:
-                    print(f"Closing window: {window}")
-                    s.activate_window(window)
-                    s.close_window(window)
-
+                windows.extend(s.get_application_windows(app))
             except Exception as e:
                 print(f"⚠️ Could not capture {app}: {e}")
 
+        # The windows are independent, close them all at once
+        print(f"Closing windows: {windows}")
+        try:
+            s.close_windows(windows)
+        except Exception as e:
+            print(f"⚠️ Could not close windows: {e}")
+
         # Final cleanup message
         s.activate_window(terminal_id)
-        sleep(1)
         s.write("echo '=== AI AGENT DEMO COMPLETED SUCCESSFULLY ==='", delay_in_ms=10)
         s.press("Enter")
         s.write(
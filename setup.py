@@ -56,6 +56,9 @@ setup(
             "pytest-asyncio>=0.21.0",
             "pytest-cov>=4.0.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
     },
     project_urls={
         "Homepage": "https://github.com/huggingface/screenenv",
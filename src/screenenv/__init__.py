@@ -1,15 +1,42 @@
-from .desktop_agent.desktop_agent_base import DesktopAgentBase
-from .logger import get_logger
-from .mcp_remote_server import MCPRemoteServer
-from .remote_screen_env import RemoteScreenEnv, StandardScreenSize
-from .sandbox import Sandbox
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .desktop_agent.desktop_agent_base import DesktopAgentBase
+    from .logger import get_logger
+    from .mcp_remote_server import MCPRemoteServer
+    from .remote_screen_env import RemoteScreenEnv, StandardScreenSize
+    from .sandbox import Sandbox
+
+# Public name -> submodule defining it. Submodules pull in playwright, smolagents
+# and the MCP client, so they are only imported on first access (PEP 562).
+_LAZY_IMPORTS = {
+    "Sandbox": ".sandbox",
+    "RemoteScreenEnv": ".remote_screen_env",
+    "get_logger": ".logger",
+    "StandardScreenSize": ".remote_screen_env",
+    "MCPRemoteServer": ".mcp_remote_server",
+    "DesktopAgentBase": ".desktop_agent.desktop_agent_base",
+}
 
 __all__ = [
     "Sandbox",
     "RemoteScreenEnv",
     "get_logger",
-    "logger",
     "StandardScreenSize",
     "MCPRemoteServer",
     "DesktopAgentBase",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
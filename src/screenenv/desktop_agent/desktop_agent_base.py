@@ -1,11 +1,15 @@
 import os
+import re
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
 from io import BytesIO
-from typing import List
+from pathlib import Path
+from typing import Hashable, List, cast
 
-from PIL import Image, ImageDraw
+from PIL import Image, ImageChops, ImageDraw
 
 # SmolaAgents imports
 from smolagents import CodeAgent, Model, Tool
@@ -196,30 +200,97 @@ The sandbox uses Ubuntu 22.04 with XFCE4 desktop environment, accessible via VNC
 - MOST OF THE TIME, IF A POPUP WINDOW APPEARS, TRY TO USE `press("enter")` TO CONFIRM OR `press("escape")` TO CANCEL TO CLOSE IT.
 - If you want to close the current window, use `press("ctrl+w")`
 </general_guidelines>
-""".replace("<<current_date>>", datetime.now().strftime("%A, %d-%B-%Y"))
+"""
 
+REPEAT_ACTION_WARNING = "WARNING: You've executed the same action several times in a row. MAKE SURE TO NOT UNNECESSARILY REPEAT ACTIONS."
 
-def draw_marker_on_image(image_copy, click_coordinates):
-    x, y = click_coordinates
-    draw = ImageDraw.Draw(image_copy)
-    cross_size, linewidth = 10, 3
+_PLACEHOLDER_RE = re.compile(r"<<(current_date|resolution_x|resolution_y)>>")
+
+
+@lru_cache(maxsize=1)
+def _format_date(day_ordinal: int) -> str:
+    return date.fromordinal(day_ordinal).strftime("%A, %d-%B-%Y")
+
+
+def current_date() -> str:
+    """Today's date as shown in the system prompt, formatted once per day"""
+    return _format_date(date.today().toordinal())
+
+
+@lru_cache(maxsize=8)
+def render_system_prompt(width: int, height: int, today: str) -> str:
+    """Fill the placeholders of the system prompt in a single pass"""
+    values = {
+        "current_date": today,
+        "resolution_x": str(width),
+        "resolution_y": str(height),
+    }
+    return _PLACEHOLDER_RE.sub(
+        lambda match: values[match.group(1)], DESKTOP_SYSTEM_PROMPT_TEMPLATE
+    )
+
+
+@lru_cache(maxsize=4)
+def _marker_stamp(cross_size: int = 10, linewidth: int = 3) -> Image.Image:
+    """Transparent RGBA stamp of the click marker, drawn once and reused"""
+    size = cross_size * 4 + 1
+    c = cross_size * 2  # center of the stamp
+    stamp = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(stamp)
     # Draw cross
-    draw.line((x - cross_size, y, x + cross_size, y), fill="green", width=linewidth)
-    draw.line((x, y - cross_size, x, y + cross_size), fill="green", width=linewidth)
+    draw.line((c - cross_size, c, c + cross_size, c), fill="green", width=linewidth)
+    draw.line((c, c - cross_size, c, c + cross_size), fill="green", width=linewidth)
     # Add a circle around it for better visibility
-    draw.ellipse(
-        (
-            x - cross_size * 2,
-            y - cross_size * 2,
-            x + cross_size * 2,
-            y + cross_size * 2,
-        ),
-        outline="green",
-        width=linewidth,
-    )
+    draw.ellipse((0, 0, size - 1, size - 1), outline="green", width=linewidth)
+    return stamp
+
+
+def draw_marker_on_image(image_copy, click_coordinates):
+    x, y = click_coordinates
+    stamp = _marker_stamp()
+    offset = stamp.width // 2
+    image_copy.paste(stamp, (int(x) - offset, int(y) - offset), stamp)
     return image_copy
 
 
+# Screenshots are compared as small grayscale thumbnails (one value per ~30x30 px
+# cell): a blinking caret moves a cell by at most ~16 levels, while dialogs, page
+# loads and window changes move whole cells by 40 and more. A freshly typed word
+# can stay under the tolerance too, so the screen must match twice in a row
+_STABLE_THUMBNAIL_SIZE = (64, 36)
+_STABLE_TOLERANCE = 24
+
+
+def _screen_thumbnail(png_bytes: bytes) -> Image.Image:
+    with Image.open(BytesIO(png_bytes)) as image:
+        return image.convert("L").resize(_STABLE_THUMBNAIL_SIZE, Image.Resampling.BOX)
+
+
+def _same_screen(a: Image.Image, b: Image.Image) -> bool:
+    """Whether two screen thumbnails differ by no more than the tolerance"""
+    _, high = cast(tuple[int, int], ImageChops.difference(a, b).getextrema())
+    return high <= _STABLE_TOLERANCE
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _tool_call_key(tool_call) -> Hashable | None:
+    """Hashable identity of a tool call, None when it has no arguments"""
+    arguments = getattr(tool_call, "arguments", None)
+    if not arguments:
+        return None
+    if isinstance(arguments, dict):
+        try:
+            arguments = tuple(sorted(arguments.items()))
+            hash(arguments)
+        except TypeError:
+            arguments = repr(arguments)
+    return getattr(tool_call, "name", None), arguments
+
+
 class DesktopAgentBase(CodeAgent, ABC):
     """Agent for desktop automation"""
 
@@ -233,18 +304,20 @@ class DesktopAgentBase(CodeAgent, ABC):
         verbosity_level: LogLevel = LogLevel.INFO,
         planning_interval: int | None = None,
         use_v1_prompt: bool = False,
+        observation_max_size: int | None = None,
         **kwargs,
     ):
         self.desktop = desktop
         self.data_dir = data_dir
+        # Longest side of the screenshot sent to the model, None for full resolution.
+        # The on-disk screenshots always keep the full resolution.
+        self.observation_max_size = observation_max_size
         self.planning_interval = planning_interval
         # Initialize Desktop
         self.width, self.height = self.desktop.get_screen_size()
-        print(f"Screen size: {self.width}x{self.height}")
 
         # Set up temp directory
-        os.makedirs(self.data_dir, exist_ok=True)
-        print(f"Screenshots and steps will be saved to: {self.data_dir}")
+        Path(self.data_dir).mkdir(parents=True, exist_ok=True)
 
         self.use_v1_prompt = use_v1_prompt
         # Initialize base agent
@@ -257,19 +330,41 @@ class DesktopAgentBase(CodeAgent, ABC):
             stream_outputs=True,
             **kwargs,
         )
-        self.prompt_templates["system_prompt"] = DESKTOP_SYSTEM_PROMPT_TEMPLATE.replace(
-            "<<resolution_x>>", str(self.width)
-        ).replace("<<resolution_y>>", str(self.height))
+        self.prompt_templates["system_prompt"] = render_system_prompt(
+            self.width, self.height, current_date()
+        )
 
         # Add screen info to state
         self.state["screen_width"] = self.width
         self.state["screen_height"] = self.height
 
+        self.logger.log(
+            f"Screen size: {self.width}x{self.height}\n"
+            f"Screenshots and steps will be saved to: {self.data_dir}"
+        )
+
         # Add default tools
         self.logger.log("Setting up agent tools...")
         self._setup_desktop_tools()
         self.step_callbacks.append(self.take_screenshot_callback)
         self.click_coordinates: tuple[int, int] | None = None
+        # Last step number whose screenshots were dropped from memory
+        self._last_cleared_step = 0
+        # Last step number seen by the callback, to detect the start of a new run
+        self._last_seen_step = 0
+        # Single background writer so saving screenshots never blocks a step
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="screenshot-io"
+        )
+        # Write of the latest screenshot, checked before the next one so that
+        # errors (disk full, bad data_dir) are raised instead of lost
+        self._pending_write: Future | None = None
+        # Hashable key of the previous step's first tool call, for repeat detection
+        self._last_tool_call_key: Hashable | None = None
+        # Screenshots opened by the callback and not closed yet, by id(). Only
+        # these are closed when dropped: other images in memory (e.g. the ones
+        # passed to `run(task, images=...)`) belong to the caller.
+        self._screenshot_images: dict[int, Image.Image] = {}
 
     @abstractmethod
     def _setup_desktop_tools(self) -> None:
@@ -292,6 +387,51 @@ class DesktopAgentBase(CodeAgent, ABC):
         # # Register the tools
         # self.tools["click"] = click
 
+    def _wait_for_stable_screenshot(
+        self, min_delay: float = 0.5, timeout: float = 2.5, interval: float = 0.25
+    ) -> bytes:
+        """
+        Waits until three consecutive screenshots look the same (or `timeout` seconds
+        have passed) and returns the last one, instead of always sleeping `timeout`.
+        Small changes such as a blinking caret are tolerated.
+        """
+        deadline = time.monotonic() + timeout
+        time.sleep(min_delay)
+        screenshot_bytes = self.desktop.screenshot()
+        thumbnail = None
+        matches = 0
+        while time.monotonic() + interval < deadline:
+            time.sleep(interval)
+            latest = self.desktop.screenshot()
+            if latest == screenshot_bytes:
+                matches += 1
+            else:
+                if thumbnail is None:
+                    thumbnail = _screen_thumbnail(screenshot_bytes)
+                latest_thumbnail = _screen_thumbnail(latest)
+                screenshot_bytes = latest
+                if _same_screen(thumbnail, latest_thumbnail):
+                    matches += 1
+                else:
+                    matches = 0
+                    thumbnail = latest_thumbnail
+            if matches == 2:
+                break
+        return screenshot_bytes
+
+    def _wait_for_pending_write(self) -> None:
+        """Wait for the previous screenshot write, re-raising its error if it failed"""
+        if self._pending_write is not None:
+            pending_write, self._pending_write = self._pending_write, None
+            pending_write.result()
+
+    def _close_screenshots(self, images) -> None:
+        """Release the pixel buffers of our own screenshots dropped from memory"""
+        for image in images or ():
+            owned = self._screenshot_images.pop(id(image), None)
+            if owned is not None and owned is image:
+                owned.close()
+
     def take_screenshot_callback(
         self, memory_step: ActionStep, agent: CodeAgent
     ) -> None:
@@ -302,70 +442,97 @@ class DesktopAgentBase(CodeAgent, ABC):
 
         current_step = memory_step.step_number
 
-        time.sleep(2.5)  # Let things happen on the desktop
-        screenshot_bytes = self.desktop.screenshot()
-        image = Image.open(BytesIO(screenshot_bytes))
+        # Let things happen on the desktop
+        screenshot_bytes = self._wait_for_stable_screenshot()
 
         # Create a filename with step number
         screenshot_path = os.path.join(self.data_dir, f"step_{current_step:03d}.png")
-        image.save(screenshot_path)
-
-        image_copy = image.copy()
+        # The sandbox already returns PNG bytes: store them as-is rather than
+        # decoding and re-encoding an identical file, off the agent's thread
+        self._wait_for_pending_write()
+        self._pending_write = self._io_pool.submit(
+            _write_bytes, screenshot_path, screenshot_bytes
+        )
+        # Pillow only decodes the pixels when they are first accessed
+        image = Image.open(BytesIO(screenshot_bytes))
 
+        # The unmarked screenshot is already on disk, so the marker can be drawn
+        # in place instead of on a full-size copy
+        image_copy = image
         if self.click_coordinates is not None:
             print("DRAWING MARKER")
-            image_copy = draw_marker_on_image(image_copy, self.click_coordinates)
-
-        self.last_marked_screenshot = AgentImage(screenshot_path)
-        print(f"Saved screenshot for step {current_step} to {screenshot_path}")
-
-        for previous_memory_step in (
-            agent.memory.steps
-        ):  # Remove previous screenshots from logs for lean processing
+            image_copy = draw_marker_on_image(image, self.click_coordinates)
+
+        if self.observation_max_size is not None:
+            # Fewer bytes to encode and upload on every model call
+            image_copy.thumbnail(
+                (self.observation_max_size, self.observation_max_size),
+                Image.Resampling.LANCZOS,
+            )
+
+        # Built from the bytes: the file may still be being written
+        self.last_marked_screenshot = AgentImage(screenshot_bytes)
+        print(f"Saving screenshot for step {current_step} to {screenshot_path}")
+
+        # Remove previous screenshots from logs for lean processing. Steps up to
+        # `_last_cleared_step` were handled by earlier callbacks, so scan backwards
+        # and stop there instead of walking the whole history every step.
+        if current_step <= self._last_seen_step:
+            # Step numbers restart with each run
+            self._last_cleared_step = 0
+            self._last_tool_call_key = None
+            # The previous run's memory may still be read, leave its images open
+            self._screenshot_images.clear()
+        self._last_seen_step = current_step
+        for previous_memory_step in reversed(agent.memory.steps):
             if (
                 isinstance(previous_memory_step, ActionStep)
                 and previous_memory_step.step_number is not None
-                and previous_memory_step.step_number <= current_step - 1
             ):
-                previous_memory_step.observations_images = None
+                if previous_memory_step.step_number <= self._last_cleared_step:
+                    break
+                if previous_memory_step.step_number <= current_step - 1:
+                    self._close_screenshots(previous_memory_step.observations_images)
+                    previous_memory_step.observations_images = None
             elif isinstance(previous_memory_step, TaskStep):
+                # The task images are the caller's: drop them without closing
                 previous_memory_step.task_images = None
+        self._last_cleared_step = current_step - 1
 
-            if (
-                isinstance(previous_memory_step, ActionStep)
-                and previous_memory_step.step_number is not None
-                and previous_memory_step.step_number == current_step - 1
-            ):
-                if (
-                    previous_memory_step.tool_calls
-                    and getattr(previous_memory_step.tool_calls[0], "arguments", None)
-                    and memory_step.tool_calls
-                    and getattr(memory_step.tool_calls[0], "arguments", None)
-                ):
-                    if (
-                        previous_memory_step.tool_calls[0].arguments
-                        == memory_step.tool_calls[0].arguments
-                    ):
-                        memory_step.observations = (
-                            (
-                                memory_step.observations
-                                + "\nWARNING: You've executed the same action several times in a row. MAKE SURE TO NOT UNNECESSARILY REPEAT ACTIONS."
-                            )
-                            if memory_step.observations
-                            else (
-                                "\nWARNING: You've executed the same action several times in a row. MAKE SURE TO NOT UNNECESSARILY REPEAT ACTIONS."
-                            )
-                        )
+        self._maybe_warn_repeat(memory_step)
 
         # Add the marker-edited image to the current memory step
+        self._screenshot_images[id(image_copy)] = image_copy
         memory_step.observations_images = [image_copy]
 
         # memory_step.observations_images = [screenshot_path] # IF YOU USE THIS INSTEAD OF ABOVE, LAUNCHING A SECOND TASK BREAKS
 
         self.click_coordinates = None  # Reset click marker
 
+    def _maybe_warn_repeat(self, memory_step: ActionStep) -> None:
+        """Warn the model when a step repeats the previous step's tool call"""
+        if not memory_step.tool_calls:
+            self._last_tool_call_key = None
+            return
+        # Compare against the key kept from the previous step rather than looking
+        # the previous step up and comparing its arguments again
+        tool_call_key = _tool_call_key(memory_step.tool_calls[0])
+        if tool_call_key is not None and tool_call_key == self._last_tool_call_key:
+            memory_step.observations = (
+                f"{memory_step.observations}\n{REPEAT_ACTION_WARNING}"
+                if memory_step.observations
+                else REPEAT_ACTION_WARNING
+            )
+        self._last_tool_call_key = tool_call_key
+
     def close(self):
         """Clean up resources"""
+        # Flush pending screenshot writes before tearing anything down
+        self._io_pool.shutdown(wait=True)
+        try:
+            self._wait_for_pending_write()
+        except Exception as e:
+            print(f"Failed to save the last screenshot: {e}")
         if self.desktop:
             print("Killing sandbox...")
             self.desktop.kill()
@@ -0,0 +1,32 @@
+import atexit
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_session: requests.Session | None = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Process-wide keep-alive HTTP session shared by every sandbox.
+    Per-sandbox headers (such as the session password) must be passed per request,
+    never set on the shared session.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                # Cookies ignore the port, so with every sandbox on localhost one
+                # sandbox's cookies would be sent to the others: keep none
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                # One pool per sandbox host:port
+                session.mount(
+                    "http://", HTTPAdapter(pool_connections=16, pool_maxsize=16)
+                )
+                atexit.register(session.close)
+                _session = session
+    return _session
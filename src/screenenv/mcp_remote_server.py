@@ -1,6 +1,6 @@
 from typing import Literal
 
-from screenenv import get_logger
+from screenenv.logger import get_logger
 from screenenv.remote_screen_env import RemoteScreenEnv, StandardScreenSize
 
 logger = get_logger(__name__)
@@ -11,6 +11,7 @@ from docker.models.containers import Container
 from filelock import FileLock
 from pydantic import BaseModel, model_validator
 
+from screenenv.json_utils import dumps
 from screenenv.logger import get_logger
 
 from ..provider import IPAddr, Provider
@@ -116,48 +117,53 @@ class DockerProvider(Provider):
         """Wait for VM to be ready by checking screenshot endpoint."""
         start_time = time.time()
         timeout = self.config.timeout
+        healthcheck = self.config.healthcheck_config
+
+        if healthcheck.endpoint is None or healthcheck.port is None:
+            logger.warning(
+                "Healthcheck endpoint or port not set, skipping healthcheck: \n"
+                "healthcheck_endpoint: %s, \n"
+                "healthcheck_port: %s",
+                healthcheck.endpoint,
+                healthcheck.port,
+            )
+            return True
 
-        def check_health():
-            if (
-                self.config.healthcheck_config.endpoint is None
-                or self.config.healthcheck_config.port is None
-            ):
-                logger.warning(
-                    "Healthcheck endpoint or port not set, skipping healthcheck: \n"
-                    "healthcheck_endpoint: %s, \n"
-                    "healthcheck_port: %s",
-                    self.config.healthcheck_config.endpoint,
-                    self.config.healthcheck_config.port,
-                )
-                return True
+        # The request is the same on every poll: build it once
+        url = f"http://localhost:{self.ports[healthcheck.port]}/{healthcheck.endpoint.lstrip('/')}"
+        headers = dict(healthcheck.headers or {})
+        body = None
+        if healthcheck.json_data:
+            body = dumps(healthcheck.json_data)
+            headers.setdefault("Content-Type", "application/json")
+
+        def check_health(session: requests.Session):
             try:
-                response = requests.request(
-                    method=self.config.healthcheck_config.method,
-                    url=f"http://localhost:{self.ports[self.config.healthcheck_config.port]}/{self.config.healthcheck_config.endpoint.lstrip('/')}",
+                response = session.request(
+                    method=healthcheck.method,
+                    url=url,
                     timeout=(10, 10),
-                    headers=(
-                        self.config.healthcheck_config.headers
-                        if self.config.healthcheck_config.headers
-                        else None
-                    ),
-                    json=(
-                        self.config.healthcheck_config.json_data
-                        if self.config.healthcheck_config.json_data
-                        else None
-                    ),
+                    headers=headers or None,
+                    data=body,
                 )
                 return response.status_code == 200
             except Exception:
                 return False
 
-        while time.time() - start_time < timeout:
-            if check_health():
-                return True
-            logger.info(
-                "🔄 Initializing virtual machine... %s seconds elapsed (this process may take a few minutes)",
-                int(time.time() - start_time),
-            )
-            time.sleep(self.config.healthcheck_config.retry_interval)
+        # One keep-alive connection for every poll. Start polling after a second
+        # and back off to `retry_interval`, so a VM that comes up between two
+        # polls is not left waiting for a full interval.
+        delay = min(1.0, healthcheck.retry_interval)
+        with requests.Session() as session:
+            while time.time() - start_time < timeout:
+                if check_health(session):
+                    return True
+                logger.info(
+                    "🔄 Initializing virtual machine... %s seconds elapsed (this process may take a few minutes)",
+                    int(time.time() - start_time),
+                )
+                time.sleep(delay)
+                delay = min(delay * 2, healthcheck.retry_interval)
 
         raise TimeoutError("VM failed to become ready within timeout period")
 
@@ -1,6 +1,7 @@
 # isort: skip_file
 
-import uuid
+import secrets
+import threading
 import webbrowser
 from typing import Literal, Optional, Union
 
@@ -46,7 +47,6 @@ StandardScreenSize = Union[
     tuple[Literal[1680], Literal[1050]],  # WSXGA+
     tuple[Literal[1920], Literal[1440]],  # Custom 4:3 ratio
     tuple[Literal[2560], Literal[1080]],  # Ultrawide Full HD
-    tuple[Literal[3440], Literal[1440]],  # Ultrawide QHD
     tuple[Literal[3840], Literal[1080]],  # Super Ultrawide Full HD
 ]
 
@@ -93,13 +93,16 @@ class RemoteScreenEnv:
                     self.stream_url += f"&password={config.session_password}"
 
                 if not config.headless:
-                    webbrowser.open(self.stream_url)
+                    # xdg-open can take a while to spawn the browser, don't wait on it
+                    threading.Thread(
+                        target=webbrowser.open, args=(self.stream_url,), daemon=True
+                    ).start()
 
         def get_auth_key(self) -> str | None:
             """Get the authentication key for the stream"""
             if self.stream_url is None:
                 logger.warning(
-                    "Stream server is disabled. Enable it by passing stream_server=True to Sandbox(...) or MCPScreenRemoteServer(...)."
+                    "Stream server is disabled. Enable it by passing stream_server=True to Sandbox(...) or MCPRemoteServer(...)."
                 )
                 return None
             if self.session_password is None or not self.session_password:
@@ -113,7 +116,7 @@ class RemoteScreenEnv:
             """Get the stream URL"""
             if self.stream_url is None:
                 logger.warning(
-                    "Stream server is disabled. Enable it by passing stream_server=True to Sandbox(...) or MCPScreenRemoteServer(...)."
+                    "Stream server is disabled. Enable it by passing stream_server=True to Sandbox(...) or MCPRemoteServer(...)."
                 )
                 return None
             if auth_key is None or not auth_key:
@@ -162,12 +165,14 @@ class RemoteScreenEnv:
         )
         self.server_type = server_type
 
+        self.resolution: tuple[int, int] = (int(resolution[0]), int(resolution[1]))
+
         # Set default environment variables
         self.environment = {
             "DISK_SIZE": disk_size,
             "RAM_SIZE": ram_size,
             "CPU_CORES": cpu_cores,
-            "SCREEN_SIZE": f"{resolution[0]}x{resolution[1]}x24",
+            "SCREEN_SIZE": f"{self.resolution[0]}x{self.resolution[1]}x24",
             "SERVER_TYPE": server_type,
             "DPI": str(dpi),
         }
@@ -185,7 +190,7 @@ class RemoteScreenEnv:
         # Generate session password for authentication
         if session_password:
             self.session_password = (
-                uuid.uuid4().hex if session_password is True else session_password
+                secrets.token_hex(16) if session_password is True else session_password
             )
         else:
             self.session_password = ""
@@ -241,16 +246,7 @@ class RemoteScreenEnv:
             raise e
 
         # Get IP address and set up base URL
-        self.ip_addr = self.provider.get_ip_address()
-        self.base_url = f"http://{self.ip_addr.ip_address}:{self.ip_addr.host_port[self.endpoint_port]}"
-        self.websocket_base_url = f"ws://{self.ip_addr.ip_address}:{self.ip_addr.host_port[self.endpoint_port]}"
-
-        self.server_url = (
-            f"{self.base_url}/api"
-            if self.server_type == "fastapi"
-            else f"{self.base_url}/mcp/"
-        )
-        self.chromium_url = f"{self.base_url}/browser/"
+        self._resolve_endpoints()
 
         self.stream = RemoteScreenEnv.StreamServer(
             config=(
@@ -266,9 +262,22 @@ class RemoteScreenEnv:
             )
         )
 
-    def get_ip_address(self):
+    def _resolve_endpoints(self) -> None:
+        """Resolve the provider address once and derive the service URLs from it"""
+        self.ip_addr = self.provider.get_ip_address()
+        self.base_url = f"http://{self.ip_addr.ip_address}:{self.ip_addr.host_port[self.endpoint_port]}"
+        self.websocket_base_url = f"ws://{self.ip_addr.ip_address}:{self.ip_addr.host_port[self.endpoint_port]}"
+
+        self.server_url = (
+            f"{self.base_url}/api"
+            if self.server_type == "fastapi"
+            else f"{self.base_url}/mcp/"
+        )
+        self.chromium_url = f"{self.base_url}/browser/"
+
+    def get_ip_address(self) -> IPAddr:
         """Get the IP address and port mappings of the environment"""
-        return self.provider.get_ip_address()
+        return self.ip_addr
 
     def get_base_url(self) -> str:
         """Get the base URL for API requests"""
@@ -299,6 +308,8 @@ class RemoteScreenEnv:
     def reset(self):
         """Reset the environment"""
         self.provider.reset()
+        # Ports are re-allocated when the container restarts
+        self._resolve_endpoints()
 
     def close(self) -> None:
         """Close the environment and clean up resources"""
@@ -1,6 +1,6 @@
 import functools
 import time
-from typing import Any, Callable, TypeVar, cast
+from typing import Any, Callable, Optional, TypeVar, cast
 
 from screenenv.logger import get_logger
 
@@ -10,15 +10,21 @@ logger = get_logger(__name__)
 
 
 def retry(
-    retry_times: int = 10, retry_interval: float = 5.0, break_on_timeout: bool = True
+    retry_times: int = 10,
+    retry_interval: float = 5.0,
+    break_on_timeout: bool = True,
+    backoff_factor: Optional[float] = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     A decorator that implements retry logic for functions that make HTTP requests.
 
     Args:
         retry_times: Number of times to retry the operation
-        retry_interval: Time to wait between retries in seconds
+        retry_interval: Time to wait between retries in seconds, or the maximum
+            wait when backoff_factor is set
         break_on_timeout: Whether to break retries on timeout exceptions
+        backoff_factor: If set, wait backoff_factor * 2**attempt seconds between
+            retries (capped at retry_interval) instead of a fixed interval
 
     Returns:
         A decorated function that implements retry logic
@@ -39,7 +45,10 @@ def retry(
                     if attempt < retry_times - 1:
                         logger.error(f"Attempt {attempt + 1} failed: {e}")
                         logger.info(f"Retrying {func.__name__}...")
-                        time.sleep(retry_interval)
+                        if backoff_factor is None:
+                            time.sleep(retry_interval)
+                        else:
+                            time.sleep(min(retry_interval, backoff_factor * 2**attempt))
                     else:
                         logger.error(
                             f"All {retry_times} attempts failed for {func.__name__}"
@@ -2,20 +2,25 @@
 
 import os
 import time
+import secrets
 import shlex
-from typing import Any, Callable, Literal, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Collection, Iterator, Literal, Optional, List
 
 import requests
-import json
 from playwright.sync_api import (
     sync_playwright,
     Browser,
     BrowserContext,
     Playwright,
 )
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 
 from screenenv.remote_screen_env import RemoteScreenEnv, StandardScreenSize
+from screenenv.http_session import get_session
+from screenenv.json_utils import dumps
 from screenenv.logger import get_logger
 from screenenv.retry_decorator import retry
 from screenenv.response_models import (
@@ -36,8 +41,29 @@ from screenenv.response_models import (
 
 logger = get_logger(__name__)
 
+
+@lru_cache(maxsize=64)
+def _import_prefix(pkgs: tuple[str, ...]) -> str:
+    """Build the `import ...; ` prefix once per distinct package list"""
+    return "".join(f"import {pkg}; " for pkg in pkgs)
+
+
+@lru_cache(maxsize=128)
+def _press_payload(key: str | tuple[str, ...]) -> bytes:
+    """JSON body of a `/press` request, encoded once per distinct key combination"""
+    return dumps(key)
+
+
 Params = dict[str, int | str]
 
+# Seconds for which `get_application_windows` results are reused, so they can be
+# this stale after an input action (key press, click, command) opened or closed a window
+WINDOW_CACHE_TTL = 0.5
+
+# Longest URL-encoded text put on the clipboard through the `/execute` query string,
+# longer text is uploaded first to stay clear of the server's request-line limit
+MAX_INLINE_CLIPBOARD = 2048
+
 
 class Sandbox(RemoteScreenEnv):
     """Client for interacting with the Android environment server"""
@@ -51,6 +77,9 @@ class Sandbox(RemoteScreenEnv):
     server_url: str
     chromium_url: str
     novnc_url: Optional[str]
+    _session: requests.Session
+    _io_pool: ThreadPoolExecutor
+    _endpoint_urls: dict[str, str]
 
     def __init__(
         self,
@@ -93,6 +122,25 @@ class Sandbox(RemoteScreenEnv):
         self.retry_times = 10
         self.retry_interval = 5
         self.pkgs_to_install: list[str] = []
+        # Commands queued by `batch()`, None when not batching
+        self._command_batch: Optional[list[str]] = None
+        # Static VM facts, fetched once (see `invalidate_vm_info`)
+        self._screen_size: Optional[tuple[int, int]] = None
+        self._platform: Optional[PlatformResponse] = None
+        self._desktop_path: Optional[DesktopPathResponse] = None
+        # Recent `get_application_windows` results: application -> (time, ids)
+        self._window_cache: dict[str, tuple[float, list[str]]] = {}
+        # Windows opened by `launch_and_focus`: launched command -> window ids
+        self.windows: dict[str, list[str]] = {}
+
+        # Keep-alive HTTP session shared with the other sandboxes of the process,
+        # so the auth header is sent per request instead of set on the session
+        self._session = get_session()
+        self._auth_headers = {"X-Session-Password": self.session_password}
+        # Worker threads used to overlap independent API calls
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="sandbox-io"
+        )
 
         # Initialize Playwright browser attributes
         self.browser: Optional[Browser] = None
@@ -102,8 +150,8 @@ class Sandbox(RemoteScreenEnv):
     def get_playwright_browser(self) -> Browser | None:
         if self.browser is None:
             logger.info("No browser found, trying to open a www.google.com")
+            # open() returns once the CDP connection attempt has finished
             self.open("https://www.google.com")
-            time.sleep(1)
             if self.browser is None:
                 logger.error("Internal Error: Failed to retrieve a playwright browser")
                 return None
@@ -112,22 +160,28 @@ class Sandbox(RemoteScreenEnv):
                 return self.browser
         return self.browser
 
-    @retry(retry_times=10, retry_interval=5.0)
+    # Waits 0.1, 0.2, ... 3.2 s then 5 s: 15 attempts keep retrying for ~46 s in
+    # total, as long as the former 10 attempts 5 s apart (45 s), so a container
+    # restart is still ridden out
+    @retry(retry_times=15, retry_interval=5.0, backoff_factor=0.1)
     def _make_request(
         self, method: str, endpoint: str, **kwargs: Any
     ) -> requests.Response:
         """Make an HTTP request with retry logic"""
-        url = self.server_url + endpoint
+        url = self._endpoint_urls.get(endpoint)
+        if url is None:
+            url = self._endpoint_urls[endpoint] = self.server_url + endpoint
         logger.info("Making request to %s", url)
 
-        # Ensure headers exist in kwargs
-        if "headers" not in kwargs:
-            kwargs["headers"] = {}
-
-        # Add session password header
-        kwargs["headers"]["X-Session-Password"] = self.session_password
-
-        response = requests.request(method, url, **kwargs)
+        headers = kwargs.pop("headers", None)
+        response = self._session.request(
+            method,
+            url,
+            headers={**self._auth_headers, **headers}
+            if headers
+            else self._auth_headers,
+            **kwargs,
+        )
         if response.status_code >= 400:
             request_info = {
                 "method": method,
@@ -161,16 +215,22 @@ class Sandbox(RemoteScreenEnv):
         if self._playwright is None:
             self._playwright = sync_playwright().start()
 
-        for attempt in range(15):
-            if attempt > 0:
-                time.sleep(5)
-
-            browser = None
+        # Chrome may still be starting: retry the CDP connection with a short
+        # exponential backoff until the deadline, then fall back to typing the URL
+        browser = None
+        delay = 0.2
+        deadline = time.monotonic() + 10
+        while browser is None:
             try:
                 browser = self._playwright.chromium.connect_over_cdp(
-                    remote_debugging_url
+                    remote_debugging_url, timeout=5000
                 )
             except Exception as e:
+                if time.monotonic() + delay < deadline:
+                    logger.debug("CDP connection not ready yet: %s", e)
+                    time.sleep(delay)
+                    delay = min(delay * 2, 2.0)
+                    continue
                 logger.error(f"Failed to connect: {e}, Falling back to manual mode")
                 self._playwright.stop()
                 self._playwright = None
@@ -181,39 +241,65 @@ class Sandbox(RemoteScreenEnv):
                 self.press("enter")
                 return None
 
-            if not browser:
-                self._playwright.stop()
-                self._playwright = None
-                return None
-
-            logger.info("Opening %s...", urls_to_open)
-            for i, url in enumerate(urls_to_open):
-                # Use the first context (which should be the only one if using default profile)
-                if i == 0:
-                    context = browser.contexts[0]
-                    context.set_extra_http_headers(
-                        {"Accept-Language": "en-US;q=0.7,en;q=0.6"}
-                    )
-                page = (
-                    context.new_page()
-                )  # Create a new page (tab) within the existing context
-                try:
-                    page.goto(url, timeout=60000)
-                except Exception:
-                    logger.warning(
-                        "Opening %s exceeds time limit", url
-                    )  # only for human test
-                logger.info(f"Opened tab {i + 1}: {url}")
-
-                if i == 0:
-                    # clear the default tab
-                    default_page = context.pages[0]
-                    default_page.close()
-
-            # Do not close the context or browser; they will remain open after script ends
-            self.browser, self.chromium_context = browser, context
-
-            break
+        logger.info("Opening %s...", urls_to_open)
+        # Use the first context (which should be the only one if using default profile)
+        context = browser.contexts[0]
+        context.set_extra_http_headers({"Accept-Language": "en-US;q=0.7,en;q=0.6"})
+        default_page = context.pages[0] if context.pages else None
+
+        # Start every navigation first so the tabs load concurrently, then wait
+        # for each one: the total wait is the slowest page, not the sum of all
+        pages = []
+        for url in urls_to_open:
+            page = (
+                context.new_page()
+            )  # Create a new page (tab) within the existing context
+            try:
+                page.goto(url, timeout=60000, wait_until="commit")
+            except Exception:
+                logger.warning(
+                    "Opening %s exceeds time limit", url
+                )  # only for human test
+            pages.append((page, url))
+
+            if default_page is not None:
+                # clear the default tab once a replacement tab exists
+                default_page.close()
+                default_page = None
+
+        for i, (page, url) in enumerate(pages):
+            try:
+                page.wait_for_load_state("load", timeout=60000)
+            except Exception:
+                logger.warning(
+                    "Opening %s exceeds time limit", url
+                )  # only for human test
+            logger.info(f"Opened tab {i + 1}: {url}")
+
+        # Do not close the context or browser; they will remain open after script ends
+        self.browser, self.chromium_context = browser, context
+
+    def _resolve_endpoints(self) -> None:
+        super()._resolve_endpoints()
+        # Full URLs per API endpoint, built on first use for the current server
+        self._endpoint_urls = {}
+
+    def invalidate_vm_info(self) -> None:
+        """Drop the cached screen size, platform and desktop path"""
+        self._screen_size = None
+        self._platform = None
+        self._desktop_path = None
+
+    def invalidate_windows(self) -> None:
+        """Drop the cached application windows"""
+        self._window_cache.clear()
+
+    def reset(self) -> None:
+        """Reset the environment"""
+        super().reset()
+        self.invalidate_vm_info()
+        self.invalidate_windows()
+        self.windows.clear()
 
     @property
     def sandbox_id(self) -> str:
@@ -233,43 +319,92 @@ class Sandbox(RemoteScreenEnv):
         timeout: int = 10,
         interval: float = 0.5,
     ) -> bool:
-        elapsed: float = 0
-        while elapsed < timeout:
+        # Poll fast first, backing off to `interval`, until the deadline passes
+        deadline = time.monotonic() + timeout
+        delay = min(0.05, interval)
+        while True:
             try:
                 if on_result(self.execute_command(command=cmd)):
                     return True
             except Exception as e:
                 logger.error(f"Error executing command {cmd}: {e}")
-                time.sleep(interval)
-                elapsed += interval
-
-        return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, interval)
 
     def execute_python_command(
         self, command: str, import_prefix: list[str]
     ) -> CommandResponse:
         """Executes a python command on the server."""
 
-        pkgs_installed = self.pkgs_to_install.copy()
         for pkg in import_prefix:
-            if pkg not in pkgs_installed:
+            if pkg not in self.pkgs_to_install:
                 # install the package
                 logger.info("Installing package: %s", pkg)
-                self.execute_command(f"pip install {pkg}")
-                self.pkgs_to_install.append(pkg)
+                # Installed right away even inside `batch()`: a queued install has
+                # not run yet, and the package is only recorded once pip succeeded
+                batch, self._command_batch = self._command_batch, None
+                try:
+                    response = self.execute_command(f"pip install {pkg}")
+                finally:
+                    self._command_batch = batch
+                if response.status == StatusEnum.SUCCESS and response.returncode == 0:
+                    self.pkgs_to_install.append(pkg)
 
-        command_code = (
-            "".join(f"import {pkg}; " for pkg in import_prefix) + f" {command}"
-        )
+        command_code = _import_prefix(tuple(import_prefix)) + f" {command}"
         command_list = ["python", "-c", shlex.quote(command_code)]
         logger.info("Executing command: %s", " ".join(command_list))
         return self.execute_command(" ".join(command_list))
 
+    @contextmanager
+    def batch(self, timeout: int = 120) -> Iterator[list[CommandResponse]]:
+        """
+        Queues the commands sent through `execute_command` (and `execute_python_command`)
+        inside the block and runs them as a single `/execute` request on exit.
+        The response of the combined command is appended to the yielded list.
+        Package installs needed by `execute_python_command` still run immediately.
+
+        Example:
+            with sandbox.batch() as responses:
+                sandbox.execute_command("mkdir -p ~/work")
+                sandbox.execute_command("touch ~/work/notes.txt")
+            print(responses[0].returncode)
+        """
+        responses: list[CommandResponse] = []
+        if self._command_batch is not None:
+            # Nested batches are merged into the outer one
+            yield responses
+            return
+
+        self._command_batch = []
+        try:
+            yield responses
+            commands = self._command_batch
+        finally:
+            self._command_batch = None
+
+        if commands:
+            responses.append(self.execute_command("\n".join(commands), timeout=timeout))
+
     def execute_command(
         self, command: str, background: bool = False, timeout: int = 120
     ) -> CommandResponse:
         """Executes a terminal command on the server."""
 
+        if self._command_batch is not None:
+            # A backgrounded child must not hold the batch's output pipes open,
+            # or the whole batch waits for it to exit
+            self._command_batch.append(
+                f"{{ {command}\n}} >/dev/null 2>&1 &" if background else command
+            )
+            return CommandResponse(
+                status=StatusEnum.PENDING,
+                message="Command queued for batch execution.",
+            )
+
+        response = None
         try:
             response = self._make_request(
                 "POST",
@@ -289,9 +424,25 @@ class Sandbox(RemoteScreenEnv):
                 message=f"Failed to execute background command {command}.",
                 output="",
                 error=str(e),
-                returncode=response.status_code,
+                returncode=response.status_code if response is not None else -1,
             )
 
+    def execute_commands(
+        self, commands: list[str], timeout: int = 120
+    ) -> list[CommandResponse]:
+        """
+        Executes independent terminal commands concurrently on the server.
+        Responses are returned in the same order as `commands`.
+        """
+        if self._command_batch is not None:
+            return [self.execute_command(command) for command in commands]
+
+        futures = [
+            self._io_pool.submit(self.execute_command, command, timeout=timeout)
+            for command in commands
+        ]
+        return [future.result() for future in futures]
+
     def get_accessibility_tree(self) -> AccessibilityTreeResponse:
         """Gets the accessibility tree of the vm."""
         response = self._make_request("GET", "/accessibility")
@@ -300,9 +451,11 @@ class Sandbox(RemoteScreenEnv):
 
     def desktop_path(self) -> DesktopPathResponse:
         """Gets the desktop path of the vm."""
-        response = self._make_request("GET", "/desktop_path")
-        logger.info("Got desktop path successfully")
-        return DesktopPathResponse(**response.json())
+        if self._desktop_path is None:
+            response = self._make_request("GET", "/desktop_path")
+            logger.info("Got desktop path successfully")
+            self._desktop_path = DesktopPathResponse(**response.json())
+        return self._desktop_path
 
     def directory_tree(self, path: str) -> DirectoryTreeResponse:
         """Gets the directory tree of the vm."""
@@ -314,18 +467,23 @@ class Sandbox(RemoteScreenEnv):
         logger.info("Got directory tree successfully")
         return DirectoryTreeResponse(**response.json())
 
+    def _stream_remote_file(self, remote_path: str, local_dest: str) -> None:
+        """Stream a remote file to disk without buffering the whole body in memory"""
+        with (
+            self._make_request(
+                "GET",
+                "/file",
+                params={"file_path": remote_path},
+                stream=True,
+            ) as response_stream,
+            open(local_dest, "wb") as f,
+        ):
+            for chunk in response_stream.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
+
     def download_file_from_remote(self, remote_path: str, local_dest: str) -> None:
         """Gets the file from the vm."""
-        response_stream = self._make_request(
-            "GET",
-            "/file",
-            params={"file_path": remote_path},
-        )
-        with open(local_dest, "wb") as f:
-            for chunk in response_stream.iter_content(chunk_size=8192):
-                if not chunk:
-                    break
-                f.write(chunk)
+        self._stream_remote_file(remote_path, local_dest)
         logger.info(
             f"Downloaded file from remote '{remote_path}' to local '{local_dest}'"
         )
@@ -387,9 +545,11 @@ class Sandbox(RemoteScreenEnv):
         """
         Gets the size of the vm screen.
         """
-        response = self._make_request("GET", "/platform")
-        logger.info("Got platform successfully")
-        return PlatformResponse(**response.json())
+        if self._platform is None:
+            response = self._make_request("GET", "/platform")
+            logger.info("Got platform successfully")
+            self._platform = PlatformResponse(**response.json())
+        return self._platform
 
     # Record video
     def start_recording(self) -> RecordingResponse:
@@ -403,16 +563,7 @@ class Sandbox(RemoteScreenEnv):
         response_end_rec = self._make_request("POST", "/end_recording")
         metadata = RecordingResponse(**response_end_rec.json())
         logger.info("Recording stopped successfully")
-        response_stream = self._make_request(
-            "GET",
-            "/file",
-            params={"file_path": metadata.path},
-        )
-        with open(dest, "wb") as f:
-            for chunk in response_stream.iter_content(chunk_size=8192):
-                if not chunk:
-                    break
-                f.write(chunk)
+        self._stream_remote_file(metadata.path, dest)
 
         return RecordingResponse(
             path=dest,
@@ -424,7 +575,8 @@ class Sandbox(RemoteScreenEnv):
         """
         Waits for the specified amount of time.
         """
-        self._make_request("POST", "/wait", params={"ms": ms})
+        # A pure delay needs no round trip: the server's /wait only spawns `sleep`
+        time.sleep(ms / 1000)
 
     def open(self, file_or_url: str) -> CommandResponse:
         """
@@ -435,6 +587,7 @@ class Sandbox(RemoteScreenEnv):
             "/open",
             params={"file_or_url": file_or_url},
         )
+        self.invalidate_windows()
         url_parsed = urlparse(file_or_url)
         if url_parsed.scheme and url_parsed.netloc:
             self._chrome_open_tabs_setup([file_or_url])
@@ -452,6 +605,7 @@ class Sandbox(RemoteScreenEnv):
                 "/launch",
                 params={"application": application, "wait_for_window": wait_for_window},
             )
+            self.invalidate_windows()
             logger.info("Launched application successfully")
             return CommandResponse(
                 status=StatusEnum.SUCCESS, output="", error="", returncode=0
@@ -465,6 +619,28 @@ class Sandbox(RemoteScreenEnv):
                 returncode=1,
             )
 
+    def launch_and_focus(
+        self, application: str, match: Optional[str] = None, timeout: float = 10
+    ) -> str:
+        """
+        Launches the application, waits for its new window and activates it.
+        `match` is the application name to look the window up by, defaulting
+        to the executable of `application`.
+        Returns the window id, or an empty string if no window appeared.
+        The id is also recorded in `self.windows[application]`.
+        """
+        match = match or application.split()[0]
+        # Windows that were already open, however they were opened, are not ours
+        self._window_cache.pop(match, None)
+        existing = set(self.get_application_windows(match))
+        if self.launch(application).status == StatusEnum.ERROR:
+            return ""
+        window_id = self.wait_for_window(match, timeout=timeout, exclude=existing)
+        if window_id:
+            self.windows.setdefault(application, []).append(window_id)
+            self.activate_window(window_id)
+        return window_id
+
     def get_current_window_id(self) -> str:
         response = self._make_request("GET", "/current_window_id")
         logger.info("Got current window ID successfully")
@@ -472,6 +648,16 @@ class Sandbox(RemoteScreenEnv):
         return window_info_response.window_id or ""
 
     def get_application_windows(self, application: str) -> list[str]:
+        """
+        Returns the ids of the application's windows.
+        Results are cached for `WINDOW_CACHE_TTL` seconds: opening, launching and
+        closing windows drop the cache, but windows opened or closed by any other
+        input action may show up late; call `invalidate_windows` first if needed.
+        """
+        cached = self._window_cache.get(application)
+        if cached is not None and time.monotonic() - cached[0] < WINDOW_CACHE_TTL:
+            return list(cached[1])
+
         response = self._make_request(
             "GET",
             "/application_windows",
@@ -479,11 +665,37 @@ class Sandbox(RemoteScreenEnv):
         )
         logger.info("Got application windows successfully")
         window_list_response = WindowListResponse(**response.json())
-        return [
-            win.window_id
-            for win in window_list_response.windows
-            if win.window_id is not None
+        # An empty xdotool search comes back as a single blank window id
+        window_ids = [
+            win.window_id for win in window_list_response.windows if win.window_id
         ]
+        self._window_cache[application] = (time.monotonic(), window_ids)
+        return list(window_ids)
+
+    def wait_for_window(
+        self,
+        application: str,
+        timeout: float = 10,
+        interval: float = 0.5,
+        exclude: Collection[str] = (),
+    ) -> str:
+        """
+        Waits until the application has a window not in `exclude` and returns its id.
+        Returns an empty string if none appeared within `timeout` seconds.
+        """
+        # Poll fast first, backing off to `interval`, until the deadline passes
+        deadline = time.monotonic() + timeout
+        delay = min(0.05, interval)
+        while True:
+            self._window_cache.pop(application, None)
+            for window_id in self.get_application_windows(application):
+                if window_id not in exclude:
+                    return window_id
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return ""
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, interval)
 
     def get_window_title(self, window_id: str) -> str:
         response = self._make_request(
@@ -516,22 +728,65 @@ class Sandbox(RemoteScreenEnv):
             "/close_window",
             params={"window_id": window_id},
         )
+        self.invalidate_windows()
+        for window_ids in self.windows.values():
+            if window_id in window_ids:
+                window_ids.remove(window_id)
         logger.info("Closed window successfully")
         return WindowInfoResponse(**response.json())
 
+    def close_windows(self, window_ids: list[str]) -> list[WindowInfoResponse]:
+        """
+        Closes independent windows concurrently.
+        Responses are returned in the same order as `window_ids`.
+        """
+        futures = [
+            self._io_pool.submit(self.close_window, window_id)
+            for window_id in window_ids
+        ]
+        return [future.result() for future in futures]
+
     def get_terminal_output(self) -> TerminalOutputResponse:
         response = self._make_request("GET", "/terminal")
         logger.info("Got terminal output successfully")
         return TerminalOutputResponse(**response.json())
 
+    def get_obs(self, require_terminal: bool = False) -> dict[str, Any]:
+        """
+        Gets an observation of the vm: a desktop screenshot and, if requested, the terminal output.
+        Both requests are sent concurrently.
+        """
+        screenshot_future = self._io_pool.submit(self.desktop_screenshot)
+        terminal_future = (
+            self._io_pool.submit(self.get_terminal_output) if require_terminal else None
+        )
+        return {
+            "screenshot": screenshot_future.result(),
+            "terminal": terminal_future.result() if terminal_future else None,
+        }
+
     # ================================
     # Keyboard and mouse actions space
     # ================================
 
-    def screenshot(self) -> bytes:
+    def screenshot(
+        self, prefer: Literal["desktop", "browser", "auto"] = "desktop"
+    ) -> bytes:
         """
         Gets a screenshot from the server. With the cursor. None -> no screenshot or unexpected error.
+        With `prefer="browser"` the visible browser viewport is captured over CDP instead,
+        raising a RuntimeError if no browser is connected or the capture fails.
+        `prefer="auto"` captures the browser when one is connected and falls back to
+        the desktop screenshot otherwise.
         """
+        if prefer == "browser" and self.chromium_context is None:
+            raise RuntimeError("No browser connected for a browser screenshot")
+        if prefer != "desktop" and self.chromium_context is not None:
+            screenshot_bytes = self.playwright_screenshot(full_page=False)
+            if screenshot_bytes is not None:
+                return screenshot_bytes
+            if prefer == "browser":
+                raise RuntimeError("Failed to take a browser screenshot")
         return self.desktop_screenshot()
 
     def left_click(self, x: Optional[int] = None, y: Optional[int] = None):
@@ -601,14 +856,17 @@ class Sandbox(RemoteScreenEnv):
 
     def get_screen_size(self) -> tuple[int, int]:
         """Gets the size of the vm screen."""
+        if self._screen_size is not None:
+            return self._screen_size
         try:
             response = self._make_request("GET", "/screen_size")
             logger.info("Got screen size successfully")
             screen_size_response = ScreenSizeResponse(**response.json())
-            return (
+            self._screen_size = (
                 screen_size_response.width,
                 screen_size_response.height,
             )
+            return self._screen_size
         except Exception as e:
             raise RuntimeError(f"Failed to get screen size: {e}") from e
 
@@ -622,7 +880,50 @@ class Sandbox(RemoteScreenEnv):
             params={"text": text, "delay_in_ms": delay_in_ms},
         )
 
-    def press(self, key: str | list[str]):
+    def _set_clipboard(self, text: str) -> bool:
+        """Puts `text` on the X clipboard of the vm, returns False on failure."""
+        # xclip stays in the background to own the selection: it must not keep
+        # the output pipes of `/execute` open, or the request waits until it exits
+        quiet = ">/dev/null 2>&1"
+        if len(quote(text)) <= MAX_INLINE_CLIPBOARD:
+            command = (
+                f"printf %s {shlex.quote(text)} | xclip -selection clipboard {quiet}"
+            )
+        else:
+            # Too long for a query parameter: send the text as an upload body
+            remote_path = f"/tmp/screenenv-clipboard-{secrets.token_hex(8)}.txt"
+            try:
+                self._make_request(
+                    "POST",
+                    "/upload",
+                    files={"file_data": ("clipboard.txt", text.encode())},
+                    data={"file_path": remote_path},
+                )
+            except Exception as e:
+                logger.error("Failed to upload clipboard text: %s", e)
+                return False
+            # xclip reads the whole file before it forks
+            command = (
+                f"xclip -selection clipboard -i {remote_path} {quiet}; "
+                f"status=$?; rm -f {remote_path}; exit $status"
+            )
+        response = self.execute_command(command)
+        return response.returncode == 0
+
+    def paste(self, text: str, hotkey: str | list[str] = "Ctrl+V") -> None:
+        """
+        Inserts the text at the current cursor position through the clipboard.
+        Sends a single paste shortcut instead of one key event per character,
+        and falls back to typing the text if the clipboard cannot be set.
+        Terminals usually need `hotkey="Ctrl+Shift+V"`.
+        """
+        if self._command_batch is not None or not self._set_clipboard(text):
+            # A queued clipboard command would only run after the paste
+            self.write(text)
+            return
+        self.press(hotkey)
+
+    def press(self, key: str | list[str] | tuple[str, ...]):
         """
         Presses a keyboard key
         """
@@ -630,7 +931,7 @@ class Sandbox(RemoteScreenEnv):
             "POST",
             "/press",
             headers={"Content-Type": "application/json"},
-            data=json.dumps(key),
+            data=_press_payload(key if isinstance(key, str) else tuple(key)),
         )
 
     def drag(self, fr: tuple[int, int], to: tuple[int, int]):
@@ -641,7 +942,7 @@ class Sandbox(RemoteScreenEnv):
             "POST",
             "/drag",
             headers={"Content-Type": "application/json"},
-            data=json.dumps({"fr": fr, "to": to}),
+            data=dumps({"fr": fr, "to": to}),
         )
 
     def close(self) -> None:
@@ -649,6 +950,9 @@ class Sandbox(RemoteScreenEnv):
         if self._playwright is not None:
             self._playwright.stop()
 
+        # The shared HTTP session is closed at interpreter exit, not here
+        self._io_pool.shutdown(wait=False)
+
         # Call parent close method to clean up Docker environment
         super().close()
 